@@ -10,20 +10,151 @@ Arguments:
 
 import asyncio
 import argparse
+import copy
+import hashlib
+import json
+import os
 import yaml
 import logging
+import logging.handlers
+import queue
 import sys
+import tempfile
+from collections import OrderedDict
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed loader when available
+except ImportError:
+    from yaml import SafeLoader
 from modules.connection_manager import ConnectionManager
 from modules.telemetry_handler import TelemetryHandler
 from modules.transition_manager import TransitionManager
 
+# Parsed configurations keyed by absolute path: (st_mtime_ns, st_size, config)
+_yaml_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 100
+
+# Directory, under the user cache directory, holding the JSON sidecars of parsed configurations
+_JSON_CACHE_DIR_NAME = 'mavsdk_vtol_transition'
 
-async def main() -> None:
+
+def _json_sidecar_path(abs_path: str) -> str:
     """
-    Main entry point for the MAVSDK VTOL Transition Control Script.
-    Parses arguments, initializes modules, executes the transition, and ensures graceful shutdown.
+    Return the path of the JSON sidecar of `abs_path`, in the user cache directory
+    ($XDG_CACHE_HOME, or ~/.cache) rather than next to the source file.
+
+    :param abs_path: Absolute path to the source YAML file.
+    :return: Path of the sidecar file.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    name = hashlib.sha1(abs_path.encode('utf-8')).hexdigest() + '.json'
+    return os.path.join(cache_home, _JSON_CACHE_DIR_NAME, name)
+
+
+def _load_json_sidecar(abs_path: str, stat: os.stat_result):
+    """
+    Return the configuration stored in the JSON sidecar of `abs_path` if it is still valid.
+
+    :param abs_path: Absolute path to the source YAML file.
+    :param stat: Current `os.stat` result of the source YAML file.
+    :return: The cached configuration, or None if the sidecar is missing or stale.
+    """
+    try:
+        with open(_json_sidecar_path(abs_path), 'r') as file:
+            sidecar = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(sidecar, dict)
+        or sidecar.get('source_path') != abs_path
+        or sidecar.get('source_mtime_ns') != stat.st_mtime_ns
+        or sidecar.get('source_size') != stat.st_size
+    ):
+        return None
+    return sidecar.get('config')
+
+
+def _write_json_sidecar(abs_path: str, stat: os.stat_result, data) -> None:
+    """
+    Write `data` to the JSON sidecar of `abs_path`, recording the source file's path, mtime and size.
+    Configurations that do not survive a JSON round trip unchanged (e.g. non-string keys) are
+    not cached. Failures are ignored; the sidecar is only an optimization.
+
+    :param abs_path: Absolute path to the source YAML file.
+    :param stat: `os.stat` result of the source YAML file at parse time.
+    :param data: Parsed configuration.
+    """
+    sidecar = {
+        'source_path': abs_path,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+        'config': data,
+    }
+    try:
+        text = json.dumps(sidecar)
+    except (TypeError, ValueError):
+        return
+    if json.loads(text)['config'] != data:
+        return
+
+    # Write to a temporary file and rename it, so a concurrent reader never sees a partial sidecar
+    sidecar_path = _json_sidecar_path(abs_path)
+    try:
+        os.makedirs(os.path.dirname(sidecar_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar_path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as file:
+            file.write(text)
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_yaml_cached(path: str):
+    """
+    Load a YAML file, reusing the previously parsed result if the file is unchanged.
+    Parsed results are kept in memory and, unless disabled with `cache_config: false` or
+    the MAVSDK_VTOL_CONFIG_CACHE=0 environment variable, in a JSON sidecar in the user cache directory.
+
+    :param path: Path to the YAML file.
+    :return: A deep copy of the parsed YAML content (callers may mutate it freely).
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+
+    cached = _yaml_cache.get(abs_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _yaml_cache.move_to_end(abs_path)
+        return copy.deepcopy(cached[2])
+
+    use_sidecar = os.environ.get('MAVSDK_VTOL_CONFIG_CACHE', '1') != '0'
+    data = _load_json_sidecar(abs_path, stat) if use_sidecar else None
+    if data is None:
+        with open(abs_path, 'r') as file:
+            data = yaml.load(file, Loader=SafeLoader)
+        if use_sidecar and isinstance(data, dict) and data.get('cache_config', True):
+            _write_json_sidecar(abs_path, stat, data)
+
+    _yaml_cache[abs_path] = (stat.st_mtime_ns, stat.st_size, data)
+    _yaml_cache.move_to_end(abs_path)
+    if len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+        _yaml_cache.popitem(last=False)  # Evict the least recently used entry
+
+    return copy.deepcopy(data)
+
+
+def _parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    :return: Parsed arguments (config path and yaw override).
     """
-    # Parse command-line arguments
     parser = argparse.ArgumentParser(
         description="Professional MAVSDK VTOL Transition Control Script"
     )
@@ -39,14 +170,53 @@ async def main() -> None:
         default=-1.0,  # Default yaw angle if not specified (-1 means use initial launch yaw)
         help='Yaw angle (degrees) to override the transition_yaw_angle parameter in the configuration.'
     )
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def _setup_logging(verbose: bool) -> logging.handlers.QueueListener:
+    """
+    Configure the root logger. Only called when the script is run directly, so importing
+    this module has no logging side effects.
+
+    :param verbose: Enable DEBUG level logging.
+    :return: The started listener; call its stop() at shutdown to flush pending records.
+    """
+    # Set up root logger (configured once). Records are queued on the event loop thread and
+    # written to the console and log file by a background listener thread.
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('mavsdk_vtol_transition.log', delay=True)  # Opened on first write
+    file_handler.setFormatter(log_formatter)
+    log_handlers = [
+        logging.StreamHandler(),  # Console output
+        # File output, written in batches (flushed immediately on warnings and errors)
+        logging.handlers.MemoryHandler(256, flushLevel=logging.WARNING, target=file_handler)
+    ]
+    log_handlers[0].setFormatter(log_formatter)
+
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format='%(message)s',  # Records are formatted by the listener's handlers
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    log_listener.start()
+    return log_listener
 
+
+def _load_config(args: argparse.Namespace) -> dict:
+    """
+    Load the configuration file and apply command-line overrides.
+    Exits the program if the configuration cannot be loaded.
+
+    :param args: Parsed command-line arguments.
+    :return: Configuration dictionary.
+    """
     # Load configuration
     try:
-        with open(args.config, 'r') as file:
-            config = yaml.safe_load(file)
-            if config is None:
-                raise ValueError("Configuration file is empty.")
+        config = load_yaml_cached(args.config)
+        if config is None:
+            raise ValueError("Configuration file is empty.")
     except FileNotFoundError:
         print(f"Configuration file not found: {args.config}. Exiting.", file=sys.stderr)
         sys.exit(1)
@@ -59,17 +229,16 @@ async def main() -> None:
 
     # Override the transition_yaw_angle parameter with the provided yaw argument
     config["transition_yaw_angle"] = args.yaw
+    return config
 
-    # Set up root logger (configured once)
-    logging.basicConfig(
-        level=logging.DEBUG if config.get('verbose_mode', False) else logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),  # Console output
-            logging.FileHandler('mavsdk_vtol_transition.log')  # File output
-        ]
-    )
 
+async def main(config: dict) -> None:
+    """
+    Main entry point for the MAVSDK VTOL Transition Control Script.
+    Initializes modules, executes the transition, and ensures graceful shutdown.
+
+    :param config: Configuration dictionary (see _load_config).
+    """
     logger = logging.getLogger('MainControl')
     logger.info("Starting MAVSDK VTOL Transition Control Script.")
 
@@ -87,7 +256,8 @@ async def main() -> None:
         verbose=config.get('verbose_mode', False)
     )
 
-    # Start telemetry subscriptions in a separate task
+    # Start telemetry subscriptions only once a system is connected: before discovery,
+    # mavsdk_server ends subscriptions right away and rejects stream rate requests
     await telemetry_handler.start_telemetry()
 
     # Initialize TransitionManager
@@ -131,9 +301,24 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Prefer the libuv-based event loop when uvloop (0.18 or later) is installed
     try:
-        asyncio.run(main())
+        from uvloop import run as run_event_loop
+    except ImportError:
+        run_event_loop = asyncio.run
+
+    args = _parse_args()
+    config = _load_config(args)
+    log_listener = _setup_logging(config.get('verbose_mode', False))
+
+    try:
+        run_event_loop(main(config))
     except Exception as e:
         # Catch any exception that wasn't handled in main
         logging.getLogger('MainControl').error(f"An unexpected error occurred: {e}")
         sys.exit(1)
+    finally:
+        # Flush queued log records, stop the listener thread and write buffered records
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.flush()
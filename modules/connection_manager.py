@@ -1,6 +1,5 @@
 # modules/connection_manager.py
 
-import asyncio
 import logging
 from mavsdk import System
 
@@ -9,6 +8,8 @@ class ConnectionManager:
     Manages the MAVSDK connection to the drone, including connecting and disconnecting.
     """
 
+    __slots__ = ('connection_type', 'connection_endpoint', 'drone', 'logger', 'is_connected')
+
     def __init__(self, config: dict):
         """
         Initialize the ConnectionManager with configuration parameters.
@@ -41,10 +42,10 @@ class ConnectionManager:
                     self.logger.info("Drone connected successfully!")
                     self.is_connected = True
                     return True
-                await asyncio.sleep(1)
         except Exception as e:
             self.logger.error(f"Error while waiting for drone connection: {e}")
             return False
+        return False
 
     async def disconnect(self) -> None:
         """
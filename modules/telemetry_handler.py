@@ -2,10 +2,87 @@
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 from mavsdk import System
-from mavsdk.telemetry import Battery, FixedwingMetrics, EulerAngle, PositionNed
-from rich.console import Console
-from rich.table import Table
+from mavsdk.telemetry import Battery, FixedwingMetrics, EulerAngle, PositionNed, PositionVelocityNed
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Rows of the verbose telemetry table: (row key, metric label)
+TELEMETRY_TABLE_ROWS = (
+    ('battery_voltage', "Battery Voltage (V)"),
+    ('battery_remaining', "Battery Remaining (%)"),
+    ('airspeed', "Airspeed (m/s)"),
+    ('throttle', "Throttle (%)"),
+    ('climb_rate', "Climb Rate (m/s)"),
+    ('roll', "Roll (°)"),
+    ('pitch', "Pitch (°)"),
+    ('yaw', "Yaw (°)"),
+    ('timestamp', "Timestamp (μs)"),
+    ('north', "North (m)"),
+    ('east', "East (m)"),
+    ('down', "Down (m)"),
+)
+
+
+@dataclass(slots=True)
+class TelemetrySnapshot:
+    """
+    Latest sample received from each telemetry stream (None until the first sample arrives),
+    plus the flight values derived from them that control loops read every cycle
+    (0.0 until the corresponding stream delivers a sample).
+    """
+    battery: Optional[Battery] = None
+    fixedwing_metrics: Optional[FixedwingMetrics] = None
+    euler_angle: Optional[EulerAngle] = None
+    position_velocity_ned: Optional[PositionVelocityNed] = None
+
+    altitude: float = 0.0  # (m) Altitude above home, i.e. -down_m
+    climb_rate: float = 0.0  # (m/s)
+    airspeed: float = 0.0  # (m/s)
+    throttle: float = 0.0  # Throttle as reported by the fixed-wing metrics
+    pitch: float = 0.0  # (deg)
+    roll: float = 0.0  # (deg)
+    yaw: float = 0.0  # (deg)
+
+
+# Telemetry stream names, i.e. the TelemetrySnapshot fields holding raw samples
+TELEMETRY_STREAMS = ('battery', 'fixedwing_metrics', 'euler_angle', 'position_velocity_ned')
+
+
+class TelemetryView(Mapping):
+    """
+    Read-only, zero-copy mapping view of a TelemetrySnapshot.
+    Keys are the stream names of the samples received so far.
+    """
+
+    __slots__ = ('_snapshot',)
+
+    _KEYS = frozenset(TELEMETRY_STREAMS)
+
+    def __init__(self, snapshot: TelemetrySnapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, key):
+        value = getattr(self._snapshot, key) if key in self._KEYS else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = getattr(self._snapshot, key) if key in self._KEYS else None
+        return default if value is None else value
+
+    def __iter__(self):
+        return (key for key in self._KEYS if getattr(self._snapshot, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
 
 class TelemetryHandler:
     """
@@ -13,6 +90,13 @@ class TelemetryHandler:
     Manages telemetry subscriptions and provides access to the latest telemetry data.
     """
 
+    __slots__ = (
+        'drone', 'update_interval', 'telemetry_rate_hz', 'verbose', 'logger', '_debug',
+        'snapshot', '_view',
+        'console', '_Live', '_Table', '_live', '_table', '_row_idx', '_rendered', '_last_raw',
+        '_render_executor', 'subscriptions', '_dirty', '_updated', '_position_updated',
+    )
+
     def __init__(self, drone: System, config: dict, verbose: bool = False):
         """
         Initialize the TelemetryHandler with drone instance and configuration.
@@ -23,137 +107,282 @@ class TelemetryHandler:
         """
         self.drone = drone
         self.update_interval = config.get('cycle_interval', 1.0)
+        self.telemetry_rate_hz = config.get('telemetry_rate_hz', 20.0)
         self.verbose = verbose
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.telemetry_data = {}
-        self.console = Console()
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)  # Resolved once, logging is configured before
+        self.snapshot = TelemetrySnapshot()
+        self._view = TelemetryView(self.snapshot)
+        self.console = None  # Rich console, only created (and rich imported) in verbose mode
+        self._Live = None
+        self._Table = None
+        if verbose:
+            from rich.console import Console
+            from rich.live import Live
+            from rich.table import Table
+            self.console = Console()
+            self._Live = Live
+            self._Table = Table
+        self._live = None  # Rich Live display, created when verbose telemetry starts
+        self._render_executor = None  # Single worker thread writing the table to the terminal
+        self._row_idx = {key: idx for idx, (key, _) in enumerate(TELEMETRY_TABLE_ROWS)}
+        # Telemetry table, built once and updated in place
+        self._table = self._build_table() if verbose else None
+        self._rendered = TelemetrySnapshot()  # Samples shown by the last render
+        self._last_raw = {}  # Raw value currently shown in each table row
         self.subscriptions = []  # List to keep track of telemetry subscription tasks
+        self._dirty = asyncio.Event()  # Set by subscriptions when a new sample arrives
+        self._updated = asyncio.Event()  # Pulsed on every sample, from any stream
+        self._position_updated = asyncio.Event()  # Pulsed on every position sample
 
     async def start_telemetry(self) -> None:
         """
         Initializes telemetry subscriptions based on verbosity.
         Starts all telemetry subscription tasks and stores them for management.
         """
+        if self.subscriptions:
+            # Starting again would orphan the running tasks, which stop_telemetry could no longer cancel
+            self.logger.warning("Telemetry subscriptions are already running.")
+            return
+
         self.logger.info("Starting telemetry subscriptions...")
 
-        # Start each telemetry subscription as a separate asyncio Task
-        self.subscriptions = [
-            asyncio.create_task(self.subscribe_battery()),
-            asyncio.create_task(self.subscribe_fixedwing_metrics()),
-            asyncio.create_task(self.subscribe_euler_angle()),
-            asyncio.create_task(self.subscribe_position_ned())
+        telemetry = self.drone.telemetry
+        coroutines = [
+            self._pump("Battery", telemetry.battery, self._on_battery),
+            self._pump("Fixed-wing metrics", telemetry.fixedwing_metrics, self._on_fixedwing_metrics),
+            self._pump("Euler angles", telemetry.attitude_euler, self._on_euler_angle),
+            self._pump("Position NED", telemetry.position_velocity_ned, self._on_position_ned),
         ]
 
-    async def subscribe_battery(self) -> None:
+        # Stream rates are requested alongside, so starting the subscriptions never waits on them
+        coroutines.append(self._set_stream_rates())
+
+        # A single renderer redraws the telemetry table at the configured interval
+        if self.verbose:
+            if self._live is None:
+                self._live = self._Live(self._table, console=self.console, auto_refresh=False)
+            self._live.start()
+            self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry-render")
+            coroutines.append(self._render_loop())
+
+        # Start each telemetry subscription as a separate asyncio Task; _pump handles its own
+        # errors, so one failing stream never takes the others down
+        self.subscriptions = [asyncio.create_task(coro) for coro in coroutines]
+
+    async def _pump(self, label: str, stream, on_sample) -> None:
         """
-        Subscribes to battery telemetry with error handling.
-        Updates telemetry data and displays it if verbose mode is enabled.
+        Consumes a telemetry stream with error handling, handing every sample to `on_sample`
+        and flagging the table for a re-render.
+
+        :param label: Stream name used in log messages.
+        :param stream: MAVSDK telemetry method returning the async sample iterator.
+        :param on_sample: Callback storing a sample in the snapshot.
         """
-        self.logger.debug("Subscribing to battery telemetry...")
+        dirty = self._dirty
+        updated = self._updated
         try:
-            async for battery in self.drone.telemetry.battery():
-                self.telemetry_data['battery'] = battery
-                await self.display_telemetry()
+            while True:
+                if self._debug:
+                    self.logger.debug("Subscribing to %s telemetry...", label)
+                async for sample in stream():
+                    on_sample(sample)
+                    dirty.set()
+                    # Wake the current waiters, then re-arm for the next sample
+                    updated.set()
+                    updated.clear()
+                # The server ended the stream (e.g. the system was lost); subscribe again
+                self.logger.warning("%s telemetry stream ended, re-subscribing.", label)
+                await asyncio.sleep(self.update_interval)
         except asyncio.CancelledError:
-            self.logger.info("Battery telemetry subscription cancelled.")
+            self.logger.info("%s telemetry subscription cancelled.", label)
         except Exception as e:
-            self.logger.error(f"Error in battery telemetry subscription: {e}")
+            self.logger.error("Error in %s telemetry subscription: %s", label, e)
 
-    async def subscribe_fixedwing_metrics(self) -> None:
+    async def _set_stream_rates(self) -> None:
         """
-        Subscribes to fixed-wing metrics telemetry with error handling.
-        Updates telemetry data and displays it if verbose mode is enabled.
+        Requests the streams read by the control loops (position, attitude, fixed-wing metrics)
+        at `telemetry_rate_hz`, so they are neither slower than the control loops need nor
+        faster than necessary. Failures are logged; the streams then keep their default rates.
         """
-        self.logger.debug("Subscribing to fixed-wing metrics telemetry...")
-        try:
-            async for metrics in self.drone.telemetry.fixedwing_metrics():
-                self.telemetry_data['fixedwing_metrics'] = metrics
-                await self.display_telemetry()
-        except asyncio.CancelledError:
-            self.logger.info("Fixed-wing metrics telemetry subscription cancelled.")
-        except Exception as e:
-            self.logger.error(f"Error in fixed-wing metrics telemetry subscription: {e}")
+        telemetry = self.drone.telemetry
+        rate_hz = self.telemetry_rate_hz
+        streams = (
+            ("Position NED", telemetry.set_rate_position_velocity_ned),
+            ("Euler angles", telemetry.set_rate_attitude_euler),
+            ("Fixed-wing metrics", telemetry.set_rate_fixedwing_metrics),
+        )
+        results = await asyncio.gather(*(set_rate(rate_hz) for _, set_rate in streams), return_exceptions=True)
+        for (label, _), result in zip(streams, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"Could not set {label} telemetry rate to {rate_hz} Hz: {result}")
+            elif self._debug:
+                self.logger.debug(f"{label} telemetry rate set to {rate_hz} Hz.")
 
-    async def subscribe_euler_angle(self) -> None:
+    def _on_battery(self, battery: Battery) -> None:
         """
-        Subscribes to Euler angles telemetry with error handling.
-        Updates telemetry data and displays it if verbose mode is enabled.
+        Stores the latest battery sample.
         """
-        self.logger.debug("Subscribing to Euler angles telemetry...")
-        try:
-            async for euler in self.drone.telemetry.attitude_euler():
-                self.telemetry_data['euler_angle'] = euler
-                await self.display_telemetry()
-        except asyncio.CancelledError:
-            self.logger.info("Euler angles telemetry subscription cancelled.")
-        except Exception as e:
-            self.logger.error(f"Error in Euler angles telemetry subscription: {e}")
+        self.snapshot.battery = battery
 
-    async def subscribe_position_ned(self) -> None:
+    def _on_fixedwing_metrics(self, metrics: FixedwingMetrics) -> None:
         """
-        Subscribes to Position NED telemetry with error handling.
-        Updates telemetry data and displays it if verbose mode is enabled.
+        Stores the latest fixed-wing metrics and the airspeed, climb rate and throttle derived from them.
         """
-        self.logger.debug("Subscribing to Position NED telemetry...")
+        snapshot = self.snapshot
+        snapshot.fixedwing_metrics = metrics
+        snapshot.airspeed = metrics.airspeed_m_s
+        snapshot.climb_rate = metrics.climb_rate_m_s
+        snapshot.throttle = metrics.throttle_percentage
+
+    def _on_euler_angle(self, euler: EulerAngle) -> None:
+        """
+        Stores the latest attitude and the pitch, roll and yaw derived from it.
+        """
+        snapshot = self.snapshot
+        snapshot.euler_angle = euler
+        snapshot.pitch = euler.pitch_deg
+        snapshot.roll = euler.roll_deg
+        snapshot.yaw = euler.yaw_deg
+
+    def _on_position_ned(self, position: PositionVelocityNed) -> None:
+        """
+        Stores the latest position, derives the altitude and wakes wait_for_position() callers.
+        """
+        snapshot = self.snapshot
+        snapshot.position_velocity_ned = position
+        snapshot.altitude = -position.position.down_m
+        # Wake the current waiters, then re-arm for the next sample
+        self._position_updated.set()
+        self._position_updated.clear()
+
+    async def _render_loop(self) -> None:
+        """
+        Renders the telemetry table when new samples arrive, at most once per update interval,
+        so any number of incoming samples results in a single render.
+        The table cells are updated on the event loop, while the terminal rendering runs on
+        the render thread; the loop awaits each render before touching the table again.
+        """
+        loop = asyncio.get_running_loop()
         try:
-            async for position in self.drone.telemetry.position_velocity_ned():
-                self.telemetry_data['position_velocity_ned'] = position
-                await self.display_telemetry()
+            while True:
+                await self._dirty.wait()
+                self._dirty.clear()
+                if self._update_table():
+                    await loop.run_in_executor(self._render_executor, self._live.refresh)
+                await asyncio.sleep(self.update_interval)
         except asyncio.CancelledError:
-            self.logger.info("Position NED telemetry subscription cancelled.")
+            self.logger.info("Telemetry display task cancelled.")
         except Exception as e:
-            self.logger.error(f"Error in Position NED telemetry subscription: {e}")
+            self.logger.error(f"Error in telemetry display task: {e}")
 
-    async def display_telemetry(self) -> None:
+    def _update_table(self) -> bool:
         """
-        Displays telemetry data in a formatted table using Rich if verbose mode is enabled.
-        Clears the console before printing to update the display.
+        Writes the samples received since the previous render into the table cells.
+
+        :return: True if at least one stream delivered a new sample, False otherwise.
         """
-        if not self.verbose:
-            return
 
-        table = Table(title="Telemetry Data", show_header=True, header_style="bold magenta")
+        values = self._table.columns[1]._cells
+        rendered = self._rendered
+        changed = False
+
+        # Update rows for streams with a sample newer than the one already displayed
+        battery = self.snapshot.battery
+        if battery is not None and battery is not rendered.battery:
+            rendered.battery = battery
+            changed = True
+            self._set_value(values, 'battery_voltage', battery.voltage_v, '.2f')
+            self._set_value(values, 'battery_remaining', battery.remaining_percent, '.2f')
+
+        metrics = self.snapshot.fixedwing_metrics
+        if metrics is not None and metrics is not rendered.fixedwing_metrics:
+            rendered.fixedwing_metrics = metrics
+            changed = True
+            self._set_value(values, 'airspeed', metrics.airspeed_m_s, '.2f')
+            self._set_value(values, 'throttle', metrics.throttle_percentage, '.2f')
+            self._set_value(values, 'climb_rate', metrics.climb_rate_m_s, '.2f')
+
+        euler = self.snapshot.euler_angle
+        if euler is not None and euler is not rendered.euler_angle:
+            rendered.euler_angle = euler
+            changed = True
+            self._set_value(values, 'roll', euler.roll_deg, '.2f')
+            self._set_value(values, 'pitch', euler.pitch_deg, '.2f')
+            self._set_value(values, 'yaw', euler.yaw_deg, '.2f')
+            self._set_value(values, 'timestamp', euler.timestamp_us, '')
+
+        position = self.snapshot.position_velocity_ned
+        if position is not None and position is not rendered.position_velocity_ned:
+            rendered.position_velocity_ned = position
+            changed = True
+            self._set_value(values, 'north', position.position.north_m, '.2f')
+            self._set_value(values, 'east', position.position.east_m, '.2f')
+            self._set_value(values, 'down', position.position.down_m, '.2f')
+
+        return changed
+
+    def _set_value(self, values: list, key: str, raw, format_spec: str) -> None:
+        """
+        Formats `raw` into the value cell of row `key`, unless that value is already shown.
+
+        :param values: Cells of the table's value column.
+        :param key: Row key from TELEMETRY_TABLE_ROWS.
+        :param raw: Raw telemetry value.
+        :param format_spec: Format specification applied to `raw`.
+        """
+        if self._last_raw.get(key) != raw:
+            self._last_raw[key] = raw
+            values[self._row_idx[key]] = format(raw, format_spec)
+
+    def _build_table(self) -> "Table":
+        """
+        Builds the telemetry table, with a placeholder value for every metric.
+
+        :return: Table whose value column is updated in place by _update_table.
+        """
+        table = self._Table(title="Telemetry Data", show_header=True, header_style="bold magenta")
 
         # Define table columns
         table.add_column("Metric", style="cyan", no_wrap=True)
         table.add_column("Value", style="magenta")
 
-        # Populate table rows based on available telemetry data
-        if 'battery' in self.telemetry_data:
-            battery = self.telemetry_data['battery']
-            table.add_row("Battery Voltage (V)", f"{battery.voltage_v:.2f}")
-            table.add_row("Battery Remaining (%)", f"{battery.remaining_percent:.2f}")
+        for _, label in TELEMETRY_TABLE_ROWS:
+            table.add_row(label, "-")
+        return table
+
+    async def wait_for_update(self) -> None:
+        """
+        Waits for the next telemetry sample, from any stream.
+        """
+        await self._updated.wait()
 
-        if 'fixedwing_metrics' in self.telemetry_data:
-            metrics = self.telemetry_data['fixedwing_metrics']
-            table.add_row("Airspeed (m/s)", f"{metrics.airspeed_m_s:.2f}")
-            table.add_row("Throttle (%)", f"{metrics.throttle_percentage:.2f}")
-            table.add_row("Climb Rate (m/s)", f"{metrics.climb_rate_m_s:.2f}")
+    async def wait_for_position(self) -> PositionVelocityNed:
+        """
+        Waits for the next position sample.
 
-        if 'euler_angle' in self.telemetry_data:
-            euler = self.telemetry_data['euler_angle']
-            table.add_row("Roll (°)", f"{euler.roll_deg:.2f}")
-            table.add_row("Pitch (°)", f"{euler.pitch_deg:.2f}")
-            table.add_row("Yaw (°)", f"{euler.yaw_deg:.2f}")
-            table.add_row("Timestamp (μs)", f"{euler.timestamp_us}")
+        :return: The new position and velocity sample.
+        """
+        await self._position_updated.wait()
+        return self.snapshot.position_velocity_ned
 
-        if 'position_velocity_ned' in self.telemetry_data:
-            position = self.telemetry_data['position_velocity_ned']
-            table.add_row("North (m)", f"{position.position.north_m:.2f}")
-            table.add_row("East (m)", f"{position.position.east_m:.2f}")
-            table.add_row("Down (m)", f"{position.position.down_m:.2f}")
+    def get_snapshot(self) -> TelemetrySnapshot:
+        """
+        Returns the live telemetry snapshot, whose derived flight values (altitude, airspeed,
+        pitch, ...) are kept up to date by the subscriptions.
 
-        # Clear the console before printing the updated table
-        self.console.clear()
-        self.console.print(table)
+        :return: The TelemetrySnapshot updated in place by the subscriptions.
+        """
+        return self.snapshot
 
-    def get_telemetry(self) -> dict:
+    def get_telemetry(self) -> Mapping:
         """
-        Returns a copy of the latest telemetry data.
+        Returns a read-only view of the latest telemetry data.
+        The view is live; use dict(view) if a stable copy is needed.
 
-        :return: Dictionary containing the latest telemetry data.
+        :return: Mapping of stream name to the latest telemetry sample.
         """
-        return dict(self.telemetry_data)  # Return a shallow copy to prevent external modifications
+        return self._view
 
     async def stop_telemetry(self) -> None:
         """
@@ -167,9 +396,21 @@ class TelemetryHandler:
             task.cancel()
 
         # Wait for all tasks to be cancelled
-        await asyncio.gather(*self.subscriptions, return_exceptions=True)
+        results = await asyncio.gather(*self.subscriptions, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error while stopping telemetry subscriptions: {result}")
 
         # Clear the subscriptions list
         self.subscriptions.clear()
 
+        # Let an in-flight render finish before releasing the terminal
+        if self._render_executor is not None:
+            self._render_executor.shutdown(wait=True)
+            self._render_executor = None
+
+        # Release the terminal held by the live display
+        if self._live is not None:
+            self._live.stop()
+
         self.logger.info("All telemetry subscriptions stopped.")
@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import random
+from math import atan2, degrees, hypot
 from mavsdk.offboard import (
     VelocityBodyYawspeed,
     VelocityNedYaw,
@@ -9,19 +11,11 @@ from mavsdk.offboard import (
     AttitudeRate,
     OffboardError,
 )
+from mavsdk.action import ActionError
 from mavsdk.mission import MissionError
+from mavsdk.telemetry import LandedState
 from modules.transition_logic.post_transition_actions import PostTransitionAction
 
-# Optionally, define an enum for your post-transition actions. If you prefer
-# to keep it simple with just strings in the config, you can skip the enum.
-#
-# from enum import Enum
-# class PostTransitionAction(Enum):
-#     CONTINUE_CURRENT_HEADING = "continue_current_heading"
-#     HOLD = "hold"
-#     RETURN_TO_LAUNCH = "return_to_launch"
-#     START_MISSION = "start_mission"
-
 
 class TailsitterPitchProgram:
     """
@@ -30,6 +24,20 @@ class TailsitterPitchProgram:
     integrated monitoring, and failsafes.
     """
 
+    __slots__ = (
+        'drone', 'config', 'fwd_transition_start_time', 'telemetry_handler', 'logger',
+        'launch_yaw_angle', 'highest_altitude',
+        'abort_event', 'transition_event', 'ramping_started_event', 'command_lock',
+        '_transition_timeout', '_transition_air_speed', '_max_roll_failsafe', '_max_altitude_failsafe',
+        '_max_pitch_failsafe', '_altitude_loss_limit', '_altitude_failsafe_threshold',
+        '_climb_rate_failsafe_threshold',
+        '_cycle_interval', '_initial_climb_height', '_initial_climb_rate', '_transition_base_altitude',
+        '_secondary_climb_rate', '_transition_yaw_angle', '_throttle_ramp_time', '_forward_transition_time',
+        '_over_tilt_enabled', '_max_allowed_tilt', '_max_throttle', '_max_tilt_pitch',
+        '_tilt_setpoint_resolution', '_throttle_setpoint_resolution', '_takeoff_timeout', '_abort_command_timeout',
+        '_position_timeout',
+    )
+
     def __init__(self, drone, config: dict, telemetry_handler):
         """
         Initialize the transition logic.
@@ -54,6 +62,35 @@ class TailsitterPitchProgram:
         # Lock to synchronize offboard command access
         self.command_lock = asyncio.Lock()
 
+        # Monitoring thresholds, resolved once from the configuration
+        self._transition_timeout = config.get("transition_timeout", 120.0)
+        self._transition_air_speed = config.get("transition_air_speed", 20.0)
+        self._max_roll_failsafe = config.get("max_roll_failsafe", 30.0)
+        self._max_altitude_failsafe = config.get("max_altitude_failsafe", 200.0)
+        self._max_pitch_failsafe = config.get("max_pitch_failsafe", 130.0)
+        self._altitude_loss_limit = config.get("altitude_loss_limit", 20.0)
+        self._altitude_failsafe_threshold = config.get("altitude_failsafe_threshold", 10.0)
+        self._climb_rate_failsafe_threshold = config.get("climb_rate_failsafe_threshold", 0.3)
+
+        # Climb and ramp parameters, resolved once from the configuration
+        self._cycle_interval = config.get("cycle_interval", 0.1)
+        self._initial_climb_height = config.get("initial_climb_height", 5.0)
+        self._initial_climb_rate = config.get("initial_climb_rate", 2.0)
+        self._transition_base_altitude = config.get("transition_base_altitude", 10.0)
+        self._secondary_climb_rate = config.get("secondary_climb_rate", 1.0)
+        self._transition_yaw_angle = config.get("transition_yaw_angle", 0.0)
+        self._throttle_ramp_time = config.get("throttle_ramp_time", 5.0)
+        self._forward_transition_time = config.get("forward_transition_time", 15.0)
+        self._over_tilt_enabled = config.get("over_tilt_enabled", False)
+        self._max_allowed_tilt = config.get("max_allowed_tilt", 110.0)
+        self._max_throttle = config.get("max_throttle", 0.8)
+        self._max_tilt_pitch = config.get("max_tilt_pitch", 80.0)
+        self._tilt_setpoint_resolution = config.get("tilt_setpoint_resolution", 0.25)
+        self._throttle_setpoint_resolution = config.get("throttle_setpoint_resolution", 0.005)
+        self._takeoff_timeout = config.get("takeoff_timeout", 10.0)
+        self._abort_command_timeout = config.get("abort_command_timeout", 1.0)
+        self._position_timeout = config.get("position_timeout", 2.0)
+
     async def execute_transition(self) -> str:
         """
         Main execution logic for the VTOL transition process.
@@ -73,6 +110,9 @@ class TailsitterPitchProgram:
 
             await self.arm_and_takeoff()
 
+            # Resolve the transition heading once, now that the launch yaw is known
+            self._transition_yaw_angle = self._resolve_transition_yaw()
+
             # Phase 2: Enter Offboard Mode
             await self.start_offboard(retries=3)
 
@@ -83,40 +123,29 @@ class TailsitterPitchProgram:
             await self.secondary_climb_phase()
 
             # Phase 5: Ramping and Monitoring (run concurrently)
-            ramping_task = asyncio.create_task(self.ramp_throttle_and_tilt())
-            monitoring_task = asyncio.create_task(self.monitor_and_switch())
-
-            done, pending = await asyncio.wait(
-                [ramping_task, monitoring_task],
-                return_when=asyncio.FIRST_COMPLETED
-            )
-
-            # Process whichever task finished first
-            for task in done:
-                result = task.result()
-                if result == "success":
-                    self.logger.info("Transition executed successfully.")
-                    # Cancel the other task(s)
-                    for pending_task in pending:
-                        pending_task.cancel()
-                    return "success"
-                elif result == "failure":
-                    self.logger.warning("Transition failed during monitoring/ramping.")
-                    for pending_task in pending:
-                        pending_task.cancel()
-                    return "failure"
-
-            # If ramping completes without triggering monitoring, wait for monitoring to finish
-            await asyncio.gather(monitoring_task, return_exceptions=True)
-            self.logger.info("Transition execution completed.")
-            return "success"
+            # The monitor decides the outcome. If the ramp fails, the task group cancels the
+            # monitor and raises here, and the transition is aborted below
+            async with asyncio.TaskGroup() as tg:
+                # The ramp is scheduled first so its first attitude setpoint goes out right away
+                ramping_task = tg.create_task(self.ramp_throttle_and_tilt(), name="ramp")
+                monitoring_task = tg.create_task(self.monitor_and_switch(), name="monitor")
+                result = await monitoring_task
+                # The ramp must not send another setpoint once the outcome is being acted on
+                ramping_task.cancel()
+
+            if result == "success":
+                self.logger.info("Transition executed successfully.")
+            else:
+                self.logger.warning("Transition failed during monitoring/ramping.")
+            return result
 
         except asyncio.CancelledError:
             self.logger.warning("Transition execution was cancelled.")
             await self.abort_transition()
             return "failure"
-        except Exception as e:
-            self.logger.error(f"Unexpected error during transition: {e}")
+        except Exception:
+            # The phases log their own errors and raise; this is the single place they abort
+            self.logger.exception("Transition failed. Aborting.")
             await self.abort_transition()
             return "failure"
 
@@ -124,6 +153,15 @@ class TailsitterPitchProgram:
         """
         Phase 1: Arm the drone and initiate takeoff.
         """
+        # Heading on the ground, used as transition heading when none is configured. The snapshot
+        # reads 0.0 (north) until the first attitude sample, so wait for a real one before arming
+        try:
+            await asyncio.wait_for(self._wait_for_attitude(), timeout=self._takeoff_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(f"No attitude telemetry within {self._takeoff_timeout}s; not arming.")
+            raise RuntimeError("Attitude telemetry unavailable before takeoff.") from None
+        self.launch_yaw_angle = self.telemetry_handler.get_snapshot().yaw
+
         self.logger.info("Arming the drone.")
         try:
             async with self.command_lock:
@@ -133,158 +171,260 @@ class TailsitterPitchProgram:
                 )
                 await self.drone.action.takeoff()
             self.logger.info("Takeoff initiated.")
-            await asyncio.sleep(5)  # Wait a few seconds for the drone to stabilize
-        except Exception as e:
+            # Proceed as soon as the autopilot reports the vehicle airborne
+            await asyncio.wait_for(self._wait_for_landed_state(LandedState.IN_AIR), timeout=self._takeoff_timeout)
+            self.logger.info("Vehicle is in the air.")
+        except ActionError as e:
+            self.logger.error(f"Takeoff failed: {e}")
+            raise
+        except asyncio.TimeoutError:
+            self.logger.error(f"Vehicle not in the air {self._takeoff_timeout}s after takeoff.")
+            raise
+        except RuntimeError as e:
             self.logger.error(f"Takeoff failed: {e}")
-            await self.abort_transition()
             raise
 
+    async def _wait_for_attitude(self) -> None:
+        """
+        Waits until at least one attitude sample has been received.
+        """
+        snapshot = self.telemetry_handler.get_snapshot()
+        while snapshot.euler_angle is None:
+            await self.telemetry_handler.wait_for_update()
+
+    async def _wait_for_landed_state(self, target_state: LandedState) -> None:
+        """
+        Waits until the autopilot reports the given landed state.
+
+        :param target_state: Landed state to wait for.
+        """
+        async for landed_state in self.drone.telemetry.landed_state():
+            if landed_state == target_state:
+                return
+        raise RuntimeError(f"Landed state stream ended before reporting {target_state.name}.")
+
+    def _resolve_transition_yaw(self) -> float:
+        """
+        Resolves the yaw angle held during the transition: the configured `transition_yaw_angle`,
+        or the launch yaw when it is -1.
+
+        :return: Transition yaw angle (deg).
+        """
+        configured_yaw = self.config.get("transition_yaw_angle", -1)
+        if configured_yaw == -1:
+            self.logger.info(f"Using launch yaw as transition heading: {self.launch_yaw_angle:.1f}°.")
+            return self.launch_yaw_angle
+        self.logger.info(f"Using configured transition heading: {configured_yaw:.1f}°.")
+        return configured_yaw
+
     async def start_offboard(self, retries: int = 3) -> None:
         """
         Phase 2: Enter offboard mode with a configurable number of retries.
         """
+        delay = 0.5  # (s) First retry delay, doubled after every failed attempt
+        seeded = False
         for attempt in range(1, retries + 1):
             try:
                 async with self.command_lock:
-                    # Initialize with zero velocity to start offboard
-                    await self.drone.offboard.set_velocity_body(
-                        VelocityBodyYawspeed(0.0, 0.0, 0.0, 0.0)
-                    )
+                    # Initialize with zero velocity to start offboard (MAVSDK keeps re-sending it)
+                    if not seeded:
+                        await self.drone.offboard.set_velocity_body(
+                            VelocityBodyYawspeed(0.0, 0.0, 0.0, 0.0)
+                        )
+                        seeded = True
                     await self.drone.offboard.start()
                 self.logger.info("Offboard mode activated.")
                 return
             except OffboardError as e:
                 self.logger.warning(f"Attempt {attempt}/{retries}: Offboard mode failed - {e}")
-                await asyncio.sleep(2)
-            except Exception as e:
-                self.logger.error(f"Unexpected error during offboard start: {e}")
-                break
+                if attempt < retries:
+                    # Exponential backoff with a little jitter, capped at 4 s
+                    await asyncio.sleep(delay + random.uniform(0.0, 0.25))
+                    delay = min(delay * 2, 4.0)
 
-        self.logger.error("Failed to enter offboard mode after retries. Aborting transition.")
-        await self.abort_transition()
+        self.logger.error("Failed to enter offboard mode after retries.")
         raise RuntimeError("Offboard mode activation failed.")
 
     async def initial_climb_phase(self) -> None:
         """
         Phase 3: Initial climb to a preliminary altitude.
         """
-        initial_climb_height = self.config.get("initial_climb_height", 5.0)
-        initial_climb_rate = self.config.get("initial_climb_rate", 2.0)
-        cycle_interval = self.config.get("cycle_interval", 0.1)
+        initial_climb_height = self._initial_climb_height
+        initial_climb_rate = self._initial_climb_rate
 
         self.logger.info(
             f"Starting initial climb to {initial_climb_height}m at {initial_climb_rate}m/s."
         )
 
-        try:
-            while True:
-                telemetry = self.telemetry_handler.get_telemetry()
-                position_velocity_ned = telemetry.get("position_velocity_ned")
-                altitude = -position_velocity_ned.position.down_m if position_velocity_ned else 0.0
-
-                if altitude >= initial_climb_height:
-                    self.logger.info(f"Reached initial climb height: {altitude:.2f}m.")
-                    break
-
-                # Positive Body Z is downward => negative velocity for upward movement
-                async with self.command_lock:
-                    await self.drone.offboard.set_velocity_body(
-                        VelocityBodyYawspeed(0.0, 0.0, -initial_climb_rate, 0.0)
-                    )
+        # Positive Body Z is downward => negative velocity for upward movement
+        setpoint = VelocityBodyYawspeed(0.0, 0.0, -initial_climb_rate, 0.0)
 
-                self.logger.info(
-                    f"Initial climb in progress... Alt: {altitude:.2f}m, Target: {initial_climb_height}m."
-                )
-                await asyncio.sleep(cycle_interval)
+        try:
+            altitude = await self._climb_to_altitude(
+                initial_climb_height,
+                lambda: self.drone.offboard.set_velocity_body(setpoint),
+                "Initial climb"
+            )
+            self.logger.info(f"Reached initial climb height: {altitude:.2f}m.")
 
         except asyncio.CancelledError:
             self.logger.warning("Initial climb phase was cancelled.")
             raise
         except Exception as e:
             self.logger.error(f"Error during initial climb phase: {e}")
-            await self.abort_transition()
             raise
 
     async def secondary_climb_phase(self) -> None:
         """
         Phase 4: Secondary climb to the transition base altitude.
         """
-        transition_base_altitude = self.config.get("transition_base_altitude", 10.0)
-        secondary_climb_rate = self.config.get("secondary_climb_rate", 1.0)
-        transition_yaw_angle = self.config.get("transition_yaw_angle", 0.0)
-        cycle_interval = self.config.get("cycle_interval", 0.1)
+        transition_base_altitude = self._transition_base_altitude
+        secondary_climb_rate = self._secondary_climb_rate
+        transition_yaw_angle = self._transition_yaw_angle
 
         self.logger.info(
             f"Starting secondary climb to {transition_base_altitude}m at {secondary_climb_rate}m/s."
         )
 
-        try:
-            while True:
-                telemetry = self.telemetry_handler.get_telemetry()
-                position_velocity_ned = telemetry.get("position_velocity_ned")
-                altitude = -position_velocity_ned.position.down_m if position_velocity_ned else 0.0
-
-                if altitude >= transition_base_altitude:
-                    self.logger.info(f"Reached transition base altitude: {altitude:.2f}m.")
-                    break
-
-                # Upward velocity in NED (down = positive)
-                async with self.command_lock:
-                    await self.drone.offboard.set_velocity_ned(
-                        VelocityNedYaw(0.0, 0.0, -secondary_climb_rate, transition_yaw_angle)
-                    )
+        # Upward velocity in NED (down = positive)
+        setpoint = VelocityNedYaw(0.0, 0.0, -secondary_climb_rate, transition_yaw_angle)
 
-                self.logger.info(
-                    f"Secondary climb in progress... Alt: {altitude:.2f}m, Target: {transition_base_altitude}m."
-                )
-                await asyncio.sleep(cycle_interval)
+        try:
+            altitude = await self._climb_to_altitude(
+                transition_base_altitude,
+                lambda: self.drone.offboard.set_velocity_ned(setpoint),
+                "Secondary climb"
+            )
+            self.logger.info(f"Reached transition base altitude: {altitude:.2f}m.")
 
         except asyncio.CancelledError:
             self.logger.warning("Secondary climb phase was cancelled.")
             raise
         except Exception as e:
             self.logger.error(f"Error during secondary climb phase: {e}")
-            await self.abort_transition()
             raise
 
+    async def _climb_to_altitude(self, target_altitude: float, send_setpoint, phase_name: str) -> float:
+        """
+        Climb until the altitude reaches `target_altitude`.
+        The climb setpoint is sent once: MAVSDK's offboard plugin keeps re-sending the last
+        setpoint to the autopilot at 20 Hz. The altitude is checked on every position sample,
+        so the threshold crossing is detected as soon as it is reported.
+
+        :param target_altitude: Altitude (m) that ends the climb.
+        :param send_setpoint: Callable returning the awaitable that sends the climb setpoint once.
+        :param phase_name: Name of the phase, used in progress logs.
+        :return: Altitude (m) at which the target was reached.
+        :raises RuntimeError: If no position sample arrives within `position_timeout`.
+        """
+        snapshot = self.telemetry_handler.get_snapshot()
+        position_timeout = self._position_timeout
+        wait_for_position = self.telemetry_handler.wait_for_position
+
+        async def wait_for_next_position():
+            # A stalled position stream must not leave the vehicle climbing in offboard forever
+            try:
+                await asyncio.wait_for(wait_for_position(), timeout=position_timeout)
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"No position telemetry for {position_timeout}s during {phase_name}.") from None
+
+        # The altitude reads 0.0 until the first position sample; wait for a real one
+        if snapshot.position_velocity_ned is None:
+            await wait_for_next_position()
+
+        if snapshot.altitude >= target_altitude:
+            return snapshot.altitude
+
+        async with self.command_lock:
+            await send_setpoint()
+
+        # Progress is logged at most once per second
+        log_progress = self.logger.isEnabledFor(logging.INFO)
+        now = asyncio.get_running_loop().time
+        next_log = now()
+
+        while snapshot.altitude < target_altitude:
+            if log_progress and now() >= next_log:
+                self.logger.info(
+                    "%s in progress... Alt: %.2fm, Target: %sm.",
+                    phase_name, snapshot.altitude, target_altitude
+                )
+                next_log = now() + 1.0
+            await wait_for_next_position()
+        return snapshot.altitude
+
     async def ramp_throttle_and_tilt(self) -> None:
         """
         Phase 5a: Gradually ramp throttle and tilt, with optional 'over-tilt' capability.
         """
         self.logger.info("Starting throttle and tilt ramping.")
-        self.fwd_transition_start_time = asyncio.get_event_loop().time()
+
+        # Event loop clock, bound once; steps are paced against deadlines on it
+        now = asyncio.get_running_loop().time
+        self.fwd_transition_start_time = now()
         self.logger.info(f"Throttle and tilt ramping started at {self.fwd_transition_start_time:.2f}.")
 
         # Signal that ramping has started (prevents race conditions in monitoring)
         self.ramping_started_event.set()
 
-        # Read config parameters
-        throttle_ramp_time = self.config.get("throttle_ramp_time", 5.0)     # seconds
-        tilt_ramp_time = self.config.get("forward_transition_time", 15.0)   # seconds
-        cycle_interval = self.config.get("cycle_interval", 0.1)            # seconds
+        # Config parameters (cached in __init__)
+        throttle_ramp_time = self._throttle_ramp_time      # seconds
+        tilt_ramp_time = self._forward_transition_time     # seconds
+        cycle_interval = self._cycle_interval              # seconds
 
-        over_tilt_enabled = self.config.get("over_tilt_enabled", False)
-        max_allowed_tilt = -1 * self.config.get("max_allowed_tilt", 110.0)   # negative degrees
-        max_throttle = self.config.get("max_throttle", 0.8)
-        max_tilt = -1 * self.config.get("max_tilt_pitch", 80.0)
-        transition_yaw_angle = self.config.get("transition_yaw_angle", 0.0)
+        over_tilt_enabled = self._over_tilt_enabled
+        max_allowed_tilt = -1 * self._max_allowed_tilt   # negative degrees
+        max_throttle = self._max_throttle
+        max_tilt = -1 * self._max_tilt_pitch
+        transition_yaw_angle = self._transition_yaw_angle
 
         # Calculate ramping step counts
         throttle_steps = int(throttle_ramp_time / cycle_interval)
         tilt_steps = int(tilt_ramp_time / cycle_interval)
         total_steps = max(throttle_steps, tilt_steps)
 
+        # Live telemetry snapshot, also read by the per-step progress logs
+        snapshot = self.telemetry_handler.get_snapshot()
+
         # Retrieve current throttle from telemetry; default to 0.7 if missing
-        telemetry = self.telemetry_handler.get_telemetry()
-        fixedwing_metrics = telemetry.get("fixedwing_metrics")
-        current_throttle = fixedwing_metrics.throttle_percentage if fixedwing_metrics else 0.7
+        current_throttle = snapshot.throttle if snapshot.fixedwing_metrics is not None else 0.7
 
-        throttle_step = ((max_throttle - current_throttle) / throttle_steps) if throttle_steps > 0 else 0
         tilt_step = (max_tilt / tilt_steps) if tilt_steps > 0 else 0
 
         throttle = current_throttle
         tilt = 0.0  # initial tilt is 0 deg
 
+        # Precompute the setpoint of every step; each ramp holds its final value once complete.
+        # Setpoints are rounded to the configured resolution, so consecutive steps that round to
+        # the same value are not re-sent
+        throttle_resolution = self._throttle_setpoint_resolution
+        tilt_resolution = self._tilt_setpoint_resolution
+        throttle_schedule = [
+            min(self._quantize(value, throttle_resolution), max_throttle)
+            for value in self._ramp_schedule(throttle, max_throttle, throttle_steps, total_steps)
+        ]
+        tilt_schedule = [
+            max(self._quantize(value, tilt_resolution), max_tilt)  # tilt is negative
+            for value in self._ramp_schedule(tilt, max_tilt, tilt_steps, total_steps)
+        ]
+        # Attitude setpoint buffer, updated in place before each send (NaN pitch forces the first send)
+        attitude = Attitude(
+            roll_deg=0.0,
+            pitch_deg=float("nan"),
+            yaw_deg=transition_yaw_angle,
+            thrust_value=throttle
+        )
+
+        # Per-step progress is logged about once per second, and only when INFO records are emitted
+        log_steps = self.logger.isEnabledFor(logging.INFO)
+        log_every = max(1, round(1.0 / cycle_interval))
+
+        # Bound once for the per-step loops
+        abort_event = self.abort_event
+        transition_event = self.transition_event
+        command_lock = self.command_lock
+        set_attitude = self.drone.offboard.set_attitude
+
         self.logger.info(
             f"Ramping throttle from {throttle:.2f} to {max_throttle:.2f} over {throttle_ramp_time:.1f}s."
         )
@@ -298,53 +438,31 @@ class TailsitterPitchProgram:
 
         try:
             # --- Phase 1: Normal ramping ---
-            for step in range(total_steps):
+            cycle_start = now()
+            for step, (throttle, tilt) in enumerate(zip(throttle_schedule, tilt_schedule)):
                 # Check if we got an abort or if the transition completed
-                if self.abort_event.is_set() or self.transition_event.is_set():
+                if abort_event.is_set() or transition_event.is_set():
                     self.logger.info("Ramping task received abort/transition signal.")
                     break
 
-                # Re-read telemetry each cycle
-                telemetry = self.telemetry_handler.get_telemetry()
-                fixedwing_metrics = telemetry.get("fixedwing_metrics")
-                euler_angle = telemetry.get("euler_angle")
-                position_velocity_ned = telemetry.get("position_velocity_ned")
-
-                # Update throttle
-                if step < throttle_steps:
-                    throttle += throttle_step
-                    throttle = min(throttle, max_throttle)
-
-                # Update tilt
-                if step < tilt_steps:
-                    tilt += tilt_step
-                    tilt = max(tilt, max_tilt)  # tilt is negative => "max()" is the more negative
-
-                # Send Attitude Command
-                async with self.command_lock:
-                    await self.drone.offboard.set_attitude(
-                        Attitude(
-                            roll_deg=0.0,
-                            pitch_deg=tilt,
-                            yaw_deg=transition_yaw_angle,
-                            thrust_value=throttle
-                        )
-                    )
+                # Send Attitude Command, only when throttle or tilt changed
+                # (MAVSDK keeps re-sending the last setpoint to the autopilot)
+                if attitude.pitch_deg != tilt or attitude.thrust_value != throttle:
+                    attitude.pitch_deg = tilt
+                    attitude.thrust_value = throttle
+                    async with command_lock:
+                        await set_attitude(attitude)
 
                 # Logging
-                current_tilt_real = euler_angle.pitch_deg if euler_angle else 0.0
-                current_airspeed_real = fixedwing_metrics.airspeed_m_s if fixedwing_metrics else 0.0
-                current_altitude_real = (
-                    -position_velocity_ned.position.down_m
-                    if position_velocity_ned else 0.0
-                )
-                self.logger.info(
-                    f"Step {step + 1}/{total_steps} | "
-                    f"Throttle: {throttle:.2f}, Tilt Cmd/Actual: {tilt:.0f}/{current_tilt_real:.0f}°, "
-                    f"Airspeed: {current_airspeed_real:.1f}m/s, Alt: {current_altitude_real:.1f}m"
-                )
+                if log_steps and (step % log_every == 0 or step == total_steps - 1):
+                    self.logger.info(
+                        "Step %d/%d | Throttle: %.2f, Tilt Cmd/Actual: %.0f/%.0f°, "
+                        "Airspeed: %.1fm/s, Alt: %.1fm",
+                        step + 1, total_steps, throttle, tilt, snapshot.pitch,
+                        snapshot.airspeed, snapshot.altitude
+                    )
 
-                await asyncio.sleep(cycle_interval)
+                cycle_start = await self._sleep_until_next_step(now, cycle_start, step, cycle_interval)
 
             # --- Phase 2: Over-Tilting (if enabled) ---
             if over_tilt_enabled and tilt > max_tilt:
@@ -357,39 +475,30 @@ class TailsitterPitchProgram:
                     f"Over-tilting from {tilt:.0f}° to {max_allowed_tilt:.0f}° "
                     f"in ~{over_tilt_steps * cycle_interval:.1f}s."
                 )
-
-                for step in range(over_tilt_steps):
-                    if self.abort_event.is_set() or self.transition_event.is_set():
+                over_tilt_schedule = [
+                    max(self._quantize(value, tilt_resolution), max_allowed_tilt)  # tilt is negative
+                    for value in self._ramp_schedule(tilt, max_allowed_tilt, over_tilt_steps, over_tilt_steps)
+                ]
+
+                cycle_start = now()
+                for step, tilt in enumerate(over_tilt_schedule):
+                    if abort_event.is_set() or transition_event.is_set():
                         self.logger.info("Over-tilting task received abort/transition signal.")
                         break
 
-                    telemetry = self.telemetry_handler.get_telemetry()
-                    fixedwing_metrics = telemetry.get("fixedwing_metrics")
-                    euler_angle = telemetry.get("euler_angle")
-
-                    tilt += tilt_step
-                    tilt = max(tilt, max_allowed_tilt)  # tilt is negative => "max()" is more negative
-
-                    async with self.command_lock:
-                        await self.drone.offboard.set_attitude(
-                            Attitude(
-                                roll_deg=0.0,
-                                pitch_deg=tilt,
-                                yaw_deg=transition_yaw_angle,
-                                thrust_value=throttle  # remains at max
-                            )
-                        )
+                    # Throttle remains at max
+                    if attitude.pitch_deg != tilt:
+                        attitude.pitch_deg = tilt
+                        async with command_lock:
+                            await set_attitude(attitude)
 
-                    current_tilt_real = euler_angle.pitch_deg if euler_angle else 0.0
-                    current_airspeed_real = fixedwing_metrics.airspeed_m_s if fixedwing_metrics else 0.0
-
-                    self.logger.info(
-                        f"Over-Tilt Step {step + 1}/{over_tilt_steps} | "
-                        f"TiltCmd/Actual: {tilt:.0f}/{current_tilt_real:.0f}°, "
-                        f"Airspeed: {current_airspeed_real:.1f}m/s"
-                    )
+                    if log_steps and (step % log_every == 0 or step == over_tilt_steps - 1):
+                        self.logger.info(
+                            "Over-Tilt Step %d/%d | TiltCmd/Actual: %.0f/%.0f°, Airspeed: %.1fm/s",
+                            step + 1, over_tilt_steps, tilt, snapshot.pitch, snapshot.airspeed
+                        )
 
-                    await asyncio.sleep(cycle_interval)
+                    cycle_start = await self._sleep_until_next_step(now, cycle_start, step, cycle_interval)
 
                 self.logger.info("Over-tilting phase complete.")
 
@@ -400,140 +509,209 @@ class TailsitterPitchProgram:
             raise
         except Exception as e:
             self.logger.error(f"Error during throttle and tilt ramping: {e}")
-            await self.abort_transition()
+            # Stop the monitor from acting on a transition that is being aborted
+            self.abort_event.set()
             raise
 
+    async def _sleep_until_next_step(self, now, cycle_start: float, step: int, cycle_interval: float) -> float:
+        """
+        Sleeps until the deadline of the step following `step`, so the time spent in each step
+        does not accumulate into drift. After an overrun the deadlines are shifted to the
+        current time instead of running the missed steps back to back.
+
+        :param now: Event loop clock (the loop's bound `time` method).
+        :param cycle_start: Event loop time at which step 0 started.
+        :param step: Index of the step that just completed.
+        :param cycle_interval: Duration of one step (s).
+        :return: Start time to use for the following steps.
+        """
+        delay = cycle_start + (step + 1) * cycle_interval - now()
+        if delay < 0.0:
+            self.logger.debug("Step %d overran its %.3fs cycle by %.3fs.", step + 1, cycle_interval, -delay)
+            cycle_start -= delay
+            delay = 0.0
+        await asyncio.sleep(delay)
+        return cycle_start
+
+    @staticmethod
+    def _ramp_schedule(start: float, end: float, ramp_steps: int, total_steps: int) -> list:
+        """
+        Builds a linear ramp from `start` to `end`, held at `end` for the remaining steps.
+
+        :param start: Value before the first step.
+        :param end: Value reached at step `ramp_steps`.
+        :param ramp_steps: Number of steps over which the value ramps (0 keeps it at `start`).
+        :param total_steps: Length of the schedule.
+        :return: Setpoint value for each of the `total_steps` steps.
+        """
+        if ramp_steps <= 0:
+            return [start] * total_steps
+        delta = end - start
+        schedule = [start + delta * (i / ramp_steps) for i in range(1, min(ramp_steps, total_steps) + 1)]
+        schedule.extend([end] * (total_steps - len(schedule)))
+        return schedule
+
+    @staticmethod
+    def _quantize(value: float, resolution: float) -> float:
+        """
+        Rounds `value` to the nearest multiple of `resolution`.
+
+        :param value: Value to round.
+        :param resolution: Rounding step; 0 or less returns `value` unchanged.
+        :return: Rounded value.
+        """
+        if resolution <= 0:
+            return value
+        return round(value / resolution) * resolution
+
     async def monitor_and_switch(self) -> str:
         """
         Phase 5b: Monitor telemetry & failsafes. 
         Transition to FW mode when conditions are met or fail if conditions are violated.
         Returns 'success' or 'failure'.
         """
-        # Config parameters
-        transition_timeout = self.config.get("transition_timeout", 120.0)
-        transition_air_speed = self.config.get("transition_air_speed", 20.0)
-        cycle_interval = self.config.get("cycle_interval", 0.1)
-
-        # Failsafes
-        max_roll_failsafe = self.config.get("max_roll_failsafe", 30.0)
-        max_altitude_failsafe = self.config.get("max_altitude_failsafe", 200.0)
-        max_pitch_failsafe = self.config.get("max_pitch_failsafe", 130.0)
-        altitude_loss_limit = self.config.get("altitude_loss_limit", 20.0)
-        altitude_failsafe_threshold = self.config.get("altitude_failsafe_threshold", 10.0)
-        climb_rate_failsafe_threshold = self.config.get("climb_rate_failsafe_threshold", 0.3)
+        transition_timeout = self._transition_timeout
 
         self.logger.info("Starting monitoring task with additional failsafe conditions.")
 
-        # Track max altitude to detect altitude loss
-        max_altitude = None
-
         try:
-            while True:
-                # Wait until ramping actually starts
-                if not self.ramping_started_event.is_set():
-                    self.logger.debug("Waiting for ramping to start...")
-                    await self.ramping_started_event.wait()
-
-                # Elapsed time
-                elapsed_time = asyncio.get_event_loop().time() - self.fwd_transition_start_time
-
-                # Telemetry
-                telemetry = self.telemetry_handler.get_telemetry()
-                position_velocity_ned = telemetry.get("position_velocity_ned")
-                euler_angle = telemetry.get("euler_angle")
-                fixedwing_metrics = telemetry.get("fixedwing_metrics")
-
-                # Parse data
-                altitude = -position_velocity_ned.position.down_m if position_velocity_ned else 0.0
-                pitch = euler_angle.pitch_deg if euler_angle else 0.0
-                roll = euler_angle.roll_deg if euler_angle else 0.0
-                airspeed = fixedwing_metrics.airspeed_m_s if fixedwing_metrics else 0.0
-                climb_rate = fixedwing_metrics.climb_rate_m_s if fixedwing_metrics else 0.0
-
-                # Track highest altitude
-                if max_altitude is None or altitude > max_altitude:
-                    max_altitude = altitude
-
-                altitude_loss = (max_altitude - altitude) if max_altitude else 0.0
-
-                self.logger.debug(
-                    f"Telemetry - Alt: {altitude:.2f}m, MaxAlt: {max_altitude:.2f}m, "
-                    f"Loss: {altitude_loss:.2f}m, Pitch: {pitch:.2f}°, Roll: {roll:.2f}°, "
-                    f"Airspeed: {airspeed:.2f}m/s, Climb: {climb_rate:.2f}m/s, "
-                    f"Time: {elapsed_time:.1f}s."
+            # Wait until ramping actually starts
+            if not self.ramping_started_event.is_set():
+                self.logger.debug("Waiting for ramping to start...")
+                await self.ramping_started_event.wait()
+
+            # The timeout counts from the start of ramping; let the event loop enforce it
+            loop = asyncio.get_running_loop()
+            remaining = transition_timeout - (loop.time() - self.fwd_transition_start_time)
+            try:
+                airspeed_reached = await asyncio.wait_for(
+                    self._watch_transition_conditions(), timeout=max(remaining, 0.0)
                 )
+            except asyncio.TimeoutError:
+                elapsed_time = loop.time() - self.fwd_transition_start_time
+                self.logger.warning(
+                    f"Transition timeout: {elapsed_time:.2f}s > {transition_timeout}s. Aborting."
+                )
+                self.abort_event.set()
+                await self.abort_transition()
+                return "failure"
 
-                # Check Failsafes
-                if abs(roll) > max_roll_failsafe:
-                    self.logger.warning(f"Roll exceeded failsafe: {roll:.2f}° > ±{max_roll_failsafe}°.")
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                if altitude > max_altitude_failsafe:
-                    self.logger.warning(f"Altitude exceeded failsafe: {altitude:.2f}m > {max_altitude_failsafe}m.")
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                if abs(pitch) > max_pitch_failsafe:
-                    self.logger.warning(f"Pitch exceeded failsafe: {pitch:.2f}° > {max_pitch_failsafe}°.")
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                if altitude_loss > altitude_loss_limit:
-                    self.logger.warning(
-                        f"Altitude loss exceeded limit: {altitude_loss:.2f}m > {altitude_loss_limit}m."
-                    )
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                if altitude < altitude_failsafe_threshold:
-                    self.logger.warning(
-                        f"Altitude below failsafe threshold: {altitude:.2f}m < {altitude_failsafe_threshold}m."
-                    )
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                if climb_rate < climb_rate_failsafe_threshold:
-                    self.logger.warning(
-                        f"Climb rate below failsafe: {climb_rate:.2f}m/s < {climb_rate_failsafe_threshold}m/s."
-                    )
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
-
-                # Check if we have enough airspeed to transition
-                if airspeed >= transition_air_speed:
-                    self.logger.info(
-                        f"Airspeed sufficient for transition: {airspeed:.2f}m/s >= {transition_air_speed}m/s."
-                    )
-                    self.transition_event.set()
-                    transition_status = await self.success_transition()
-                    return transition_status
-
-                # Timeout
-                if elapsed_time > transition_timeout:
-                    self.logger.warning(
-                        f"Transition timeout: {elapsed_time:.2f}s > {transition_timeout}s. Aborting."
-                    )
-                    self.abort_event.set()
-                    await self.abort_transition()
-                    return "failure"
+            if airspeed_reached:
+                self.transition_event.set()
+                transition_status = await self.success_transition()
+                return transition_status
 
-                await asyncio.sleep(cycle_interval)
+            self.abort_event.set()
+            await self.abort_transition()
+            return "failure"
 
         except asyncio.CancelledError:
             self.logger.warning("Monitoring task was cancelled.")
             return "failure"
         except Exception as e:
             self.logger.error(f"Error during monitoring: {e}")
+            self.abort_event.set()
             await self.abort_transition()
             return "failure"
 
+    async def _watch_transition_conditions(self) -> bool:
+        """
+        Evaluate every new telemetry sample until the transition airspeed is reached or a failsafe trips.
+        Only reads telemetry and logs; the resulting switch or abort is left to the caller,
+        so cancelling this coroutine (e.g. on timeout) never interrupts a flight-mode change.
+
+        :return: True if the transition airspeed was reached, False if a failsafe was triggered.
+        """
+        # Config parameters (cached in __init__), bound to locals for the loop
+        transition_air_speed = self._transition_air_speed
+        wait_for_update = self.telemetry_handler.wait_for_update
+
+        # Failsafes
+        max_roll_failsafe = self._max_roll_failsafe
+        max_altitude_failsafe = self._max_altitude_failsafe
+        max_pitch_failsafe = self._max_pitch_failsafe
+        altitude_loss_limit = self._altitude_loss_limit
+        altitude_failsafe_threshold = self._altitude_failsafe_threshold
+        climb_rate_failsafe_threshold = self._climb_rate_failsafe_threshold
+
+        # Track max altitude to detect altitude loss
+        max_altitude = None
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        now = asyncio.get_running_loop().time
+
+        while True:
+            # Telemetry
+            snapshot = self.telemetry_handler.get_snapshot()
+
+            # The derived values read 0.0 until their stream delivers a first sample, which
+            # would trip the altitude and climb-rate failsafes; wait for real data instead
+            if (snapshot.position_velocity_ned is None or snapshot.fixedwing_metrics is None
+                    or snapshot.euler_angle is None):
+                await wait_for_update()
+                continue
+
+            altitude = snapshot.altitude
+            pitch = snapshot.pitch
+            roll = snapshot.roll
+            airspeed = snapshot.airspeed
+            climb_rate = snapshot.climb_rate
+
+            # Track highest altitude
+            if max_altitude is None or altitude > max_altitude:
+                max_altitude = altitude
+
+            altitude_loss = (max_altitude - altitude) if max_altitude else 0.0
+
+            if debug:
+                self.logger.debug(
+                    "Telemetry - Alt: %.2fm, MaxAlt: %.2fm, Loss: %.2fm, Pitch: %.2f°, Roll: %.2f°, "
+                    "Airspeed: %.2fm/s, Climb: %.2fm/s, Time: %.1fs.",
+                    altitude, max_altitude, altitude_loss, pitch, roll, airspeed, climb_rate,
+                    now() - self.fwd_transition_start_time
+                )
+
+            # Check Failsafes
+            if abs(roll) > max_roll_failsafe:
+                self.logger.warning(f"Roll exceeded failsafe: {roll:.2f}° > ±{max_roll_failsafe}°.")
+                return False
+
+            if altitude > max_altitude_failsafe:
+                self.logger.warning(f"Altitude exceeded failsafe: {altitude:.2f}m > {max_altitude_failsafe}m.")
+                return False
+
+            if abs(pitch) > max_pitch_failsafe:
+                self.logger.warning(f"Pitch exceeded failsafe: {pitch:.2f}° > {max_pitch_failsafe}°.")
+                return False
+
+            if altitude_loss > altitude_loss_limit:
+                self.logger.warning(
+                    f"Altitude loss exceeded limit: {altitude_loss:.2f}m > {altitude_loss_limit}m."
+                )
+                return False
+
+            if altitude < altitude_failsafe_threshold:
+                self.logger.warning(
+                    f"Altitude below failsafe threshold: {altitude:.2f}m < {altitude_failsafe_threshold}m."
+                )
+                return False
+
+            if climb_rate < climb_rate_failsafe_threshold:
+                self.logger.warning(
+                    f"Climb rate below failsafe: {climb_rate:.2f}m/s < {climb_rate_failsafe_threshold}m/s."
+                )
+                return False
+
+            # Check if we have enough airspeed to transition
+            if airspeed >= transition_air_speed:
+                self.logger.info(
+                    f"Airspeed sufficient for transition: {airspeed:.2f}m/s >= {transition_air_speed}m/s."
+                )
+                return True
+
+            # Re-evaluate as soon as the next sample arrives
+            await wait_for_update()
+
     async def success_transition(self) -> str:
         """
         Called when the transition to fixed-wing is determined to be 'successful'.
@@ -543,28 +721,27 @@ class TailsitterPitchProgram:
           3) Calls the post-transition action handler
         Returns 'success' or 'failure'.
         """
-        telemetry = self.telemetry_handler.get_telemetry()
-        position_velocity_ned = telemetry.get("position_velocity_ned")
+        snapshot = self.telemetry_handler.get_snapshot()
+        position_velocity_ned = snapshot.position_velocity_ned
 
-        fixedwing_metrics = telemetry.get("fixedwing_metrics")
-        current_throttle = fixedwing_metrics.throttle_percentage if fixedwing_metrics else 0.7
+        current_throttle = snapshot.throttle if snapshot.fixedwing_metrics is not None else 0.7
 
         # Calculate current horizontal velocity
         if position_velocity_ned:
             vx = position_velocity_ned.velocity.north_m_s
             vy = position_velocity_ned.velocity.east_m_s
-            horizontal_velocity = (vx**2 + vy**2) ** 0.5
+            horizontal_velocity = hypot(vx, vy)
         else:
-            horizontal_velocity = self.config.get("transition_air_speed", 20.0)
+            horizontal_velocity = self._transition_air_speed
 
         # Acceleration factor
         acceleration_factor = self.config.get("acceleration_factor", 1.0)
         target_horizontal_velocity = horizontal_velocity * acceleration_factor
 
-        self.logger.info(f"Current Horizontal Velocity: {horizontal_velocity:.2f} m/s")
+        self.logger.info("Current Horizontal Velocity: %.2f m/s", horizontal_velocity)
         self.logger.info(
-            f"Target Horizontal Velocity after applying accel factor {acceleration_factor}: "
-            f"{target_horizontal_velocity:.2f} m/s"
+            "Target Horizontal Velocity after applying accel factor %s: %.2f m/s",
+            acceleration_factor, target_horizontal_velocity
         )
 
         #TODO: add like last vresion intiall body accelrateon
@@ -602,7 +779,7 @@ class TailsitterPitchProgram:
             async with self.command_lock:
                             await self.drone.offboard.stop()
             self.logger.info("Offboard mode stopped after acceleration phase.")
-        except Exception as e:
+        except OffboardError as e:
             self.logger.error(f"Error stopping offboard mode: {e}")
                         
         
@@ -620,7 +797,7 @@ class TailsitterPitchProgram:
 
             return "success"
 
-        except Exception as e:
+        except ActionError as e:
             self.logger.error(f"Error during fixed-wing transition: {e}")
             await self.abort_transition()
             return "failure"
@@ -639,14 +816,9 @@ class TailsitterPitchProgram:
         self.logger.info(f"Post-transition action requested: '{action_name}'")
 
         try:
-            if action_name == PostTransitionAction.CONTINUE_CURRENT_HEADING.value:
-                await self._continue_current_heading()
-
-            elif action_name == PostTransitionAction.HOLD.value:
-                await self._hold_mode()
-
-            elif action_name == PostTransitionAction.START_MISSION.value:
-                await self._start_mission()
+            handler = self._POST_TRANSITION_HANDLERS.get(action_name)
+            if handler is not None:
+                await handler(self)
 
             #Default or explicit: return_to_launch
             else:
@@ -671,31 +843,31 @@ class TailsitterPitchProgram:
         self.logger.info("Offfboard mode started again... Continuing on current heading with offboard velocity setpoints.")
 
         # Example: read current velocities from telemetry
-        telemetry = self.telemetry_handler.get_telemetry()
-        position_velocity_ned = telemetry.get("position_velocity_ned")
-        euler_angle = telemetry.get("euler_angle")
-        current_yaw = euler_angle.yaw_deg
-        transition_air_speed = self.config.get("transition_air_speed", 20.0)
-        position_velocity_ned = telemetry.get("position_velocity_ned")
+        snapshot = self.telemetry_handler.get_snapshot()
+        position_velocity_ned = snapshot.position_velocity_ned
+        current_yaw = snapshot.yaw
+        transition_air_speed = self._transition_air_speed
         if not position_velocity_ned:
             self.logger.warning("No position_velocity_ned; defaulting forward velocity to transition airspeed in body.")
             vel_fwd, vel_right, vel_d = transition_air_speed, 0.0, 0.0
-            yaw_rate_deg = 0
-            await self.drone.offboard.set_velocity_body(
-                VelocityBodyYawspeed(vel_fwd, vel_right, vel_d, yaw_rate_deg)
-            )
+            yaw_rate_deg = 0.0
+            async with self.command_lock:
+                await self.drone.offboard.set_velocity_body(
+                    VelocityBodyYawspeed(vel_fwd, vel_right, vel_d, yaw_rate_deg)
+                )
 
             self.logger.info(
-                f"Set velocity Body to FWD:{vel_right:.2f} E:{vel_right:.2f} D:{vel_d:.2f}, yaw:{yaw_rate_deg:.1f}°."
+                "Set velocity Body to FWD:%.2f RIGHT:%.2f DOWN:%.2f, yawspeed:%.1f°/s.",
+                vel_fwd, vel_right, vel_d, yaw_rate_deg
             )
-            
-        else:
-            vel_n = position_velocity_ned.velocity.north_m_s
-            vel_e = position_velocity_ned.velocity.east_m_s
-            # Zero vertical speed => maintain altitude
-            vel_d = 0.0
-            # Yaw could be derived from arctan2(vel_e, vel_n), or just set to 0
-            yaw_deg = current_yaw
+            return
+
+        vel_n = position_velocity_ned.velocity.north_m_s
+        vel_e = position_velocity_ned.velocity.east_m_s
+        # Zero vertical speed => maintain altitude
+        vel_d = 0.0
+        # Point the nose along the velocity vector; keep the current yaw when too slow for a reliable course
+        yaw_deg = degrees(atan2(vel_e, vel_n)) if hypot(vel_n, vel_e) > 1.0 else current_yaw
 
         async with self.command_lock:
             await self.drone.offboard.set_velocity_ned(
@@ -703,7 +875,7 @@ class TailsitterPitchProgram:
             )
 
         self.logger.info(
-            f"Set velocity NED to N:{vel_n:.2f} E:{vel_e:.2f} D:{vel_d:.2f}, yaw:{yaw_deg:.1f}°."
+            "Set velocity NED to N:%.2f E:%.2f D:%.2f, yaw:%.1f°.", vel_n, vel_e, vel_d, yaw_deg
         )
         # Up to you whether to remain in offboard or switch to another mode after some time
 
@@ -737,8 +909,14 @@ class TailsitterPitchProgram:
         except MissionError as e:
             self.logger.error(f"Failed to start mission: {e}")
             
-        self.logger.info(f"Started the uploaded mission.")
-        
+        self.logger.info("Started the uploaded mission.")
+
+    # Post-transition action handlers, keyed by PostTransitionAction value (return_to_launch is the default)
+    _POST_TRANSITION_HANDLERS = {
+        PostTransitionAction.CONTINUE_CURRENT_HEADING.value: _continue_current_heading,
+        PostTransitionAction.HOLD.value: _hold_mode,
+        PostTransitionAction.START_MISSION.value: _start_mission,
+    }
 
     async def abort_transition(self) -> str:
         """
@@ -747,29 +925,38 @@ class TailsitterPitchProgram:
         """
         self.logger.error("Aborting transition and initiating fail-safe procedures.")
 
-        # Attempt transition to multicopter if configured
-        try:
-            if self.config.get("failsafe_multicopter_transition", True):
-                async with self.command_lock:
-                    await self.drone.action.transition_to_multicopter()
-                self.logger.info("Transitioned to multicopter mode for safety.")
-        except Exception as e:
-            self.logger.warning(f"Error transitioning to multicopter: {e}")
+        # Every abort command is bounded so an unanswered one cannot hold up the ones after it
+        timeout = self._abort_command_timeout
 
-        # Stop offboard
-        try:
-            async with self.command_lock:
-                await self.drone.offboard.stop()
+        # Transition to multicopter (if configured) and stop offboard concurrently: the VTOL
+        # transition command does not depend on the flight mode, so neither waits for the other
+        multicopter_transition = self.config.get("failsafe_multicopter_transition", True)
+        commands = [asyncio.wait_for(self.drone.offboard.stop(), timeout)]
+        if multicopter_transition:
+            commands.append(asyncio.wait_for(self.drone.action.transition_to_multicopter(), timeout))
+        async with self.command_lock:
+            results = await asyncio.gather(*commands, return_exceptions=True)
+
+        # Stop offboard (a timeout has an empty message)
+        if isinstance(results[0], BaseException):
+            self.logger.error(f"Error stopping offboard mode: {str(results[0]) or 'timed out'}")
+        else:
             self.logger.info("Offboard mode stopped.")
-        except Exception as e:
-            self.logger.error(f"Error stopping offboard mode: {e}")
 
-        # Return to Launch as a final fallback
+        # Attempt transition to multicopter if configured
+        if multicopter_transition:
+            if isinstance(results[1], BaseException):
+                self.logger.warning(f"Error transitioning to multicopter: {str(results[1]) or 'timed out'}")
+            else:
+                self.logger.info("Transitioned to multicopter mode for safety.")
+
+        # Return to Launch as a final fallback, only once the offboard stop has settled so
+        # the resulting flight mode change cannot override RTL
         try:
             async with self.command_lock:
-                await self.drone.action.return_to_launch()
+                await asyncio.wait_for(self.drone.action.return_to_launch(), timeout)
             self.logger.info("Return to Launch initiated for fail-safe.")
         except Exception as e:
-            self.logger.error(f"Error initiating Return to Launch: {e}")
+            self.logger.error(f"Error initiating Return to Launch: {str(e) or 'timed out'}")
 
         return "failure"
@@ -4,7 +4,6 @@ import logging
 from typing import Type, Dict
 from .transition_logic.base_transition import BaseTransition
 from .transition_logic.tailsitter_pitch_program import TailsitterPitchProgram
-from .transition_logic.post_transition_actions import PostTransitionAction
 
 # Import other transition classes as needed
 
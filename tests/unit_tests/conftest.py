@@ -0,0 +1,44 @@
+# tests/unit_tests/conftest.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mavsdk.telemetry import EulerAngle, FixedwingMetrics, PositionNed, PositionVelocityNed, VelocityNed
+
+from modules.telemetry_handler import TelemetryHandler
+from modules.transition_logic.tailsitter_pitch_program import TailsitterPitchProgram
+
+
+class FakeDrone:
+    """
+    Stand-in for mavsdk.System: every action, offboard and mission call is an AsyncMock,
+    and telemetry streams are assigned per test.
+    """
+
+    def __init__(self):
+        self.action = AsyncMock()
+        self.offboard = AsyncMock()
+        self.mission = AsyncMock()
+        self.telemetry = MagicMock()
+
+
+def feed_samples(handler: TelemetryHandler, altitude: float = 12.0, airspeed: float = 0.0,
+                 pitch: float = 0.0, climb_rate: float = 1.0) -> None:
+    """
+    Hands one sample of every control stream to the handler, as its subscriptions would.
+    """
+    handler._on_position_ned(PositionVelocityNed(PositionNed(0.0, 0.0, -altitude), VelocityNed(0.0, 0.0, 0.0)))
+    handler._on_fixedwing_metrics(FixedwingMetrics(airspeed, 0.5, climb_rate))
+    handler._on_euler_angle(EulerAngle(0.0, pitch, 90.0, 0))
+
+
+@pytest.fixture
+def make_program():
+    """
+    Builds a TailsitterPitchProgram on a FakeDrone with a (not started) TelemetryHandler.
+    """
+    def make(**config):
+        drone = FakeDrone()
+        handler = TelemetryHandler(drone, config)
+        return TailsitterPitchProgram(drone, config, handler)
+    return make
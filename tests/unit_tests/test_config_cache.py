@@ -0,0 +1,131 @@
+# tests/unit_tests/test_config_cache.py
+
+import json
+import os
+
+import pytest
+
+import main_control
+from main_control import load_yaml_cached
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv('MAVSDK_VTOL_CONFIG_CACHE', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / "cache"))
+    main_control._yaml_cache.clear()
+    yield
+    main_control._yaml_cache.clear()
+
+
+def _sidecar(path):
+    return main_control._json_sidecar_path(str(path))
+
+
+def _tamper_sidecar(path, config):
+    # Replace the cached configuration while keeping the recorded source mtime and size
+    with open(_sidecar(path)) as file:
+        sidecar = json.load(file)
+    sidecar['config'] = config
+    with open(_sidecar(path), 'w') as file:
+        json.dump(sidecar, file)
+
+
+def test_writes_sidecar_and_reuses_it(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.1}
+    assert os.path.exists(_sidecar(path))
+    # The sidecar lives in the cache directory, not next to the (tracked) configuration
+    assert os.listdir(tmp_path / "cache" / main_control._JSON_CACHE_DIR_NAME) == [os.path.basename(_sidecar(path))]
+    assert sorted(os.listdir(tmp_path)) == ["cache", "config.yaml"]
+
+    # A fresh process (empty in-memory cache) reads the still-valid sidecar
+    _tamper_sidecar(path, {'cycle_interval': 0.5})
+    main_control._yaml_cache.clear()
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.5}
+
+
+def test_sidecar_invalidated_when_size_changes(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+    load_yaml_cached(str(path))
+    _tamper_sidecar(path, {'cycle_interval': 0.5})
+    stat = os.stat(path)
+
+    path.write_text("cycle_interval: 0.25\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Same mtime, different size
+
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.25}
+
+
+def test_sidecar_invalidated_when_mtime_changes(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+    load_yaml_cached(str(path))
+    _tamper_sidecar(path, {'cycle_interval': 0.5})
+    stat = os.stat(path)
+
+    path.write_text("cycle_interval: 0.2\n")  # Same size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.2}
+
+
+def test_sidecar_ignored_for_another_source(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+    load_yaml_cached(str(path))
+    _tamper_sidecar(path, {'cycle_interval': 0.5})
+    with open(_sidecar(path)) as file:
+        sidecar = json.load(file)
+    sidecar['source_path'] = str(tmp_path / "other.yaml")
+    with open(_sidecar(path), 'w') as file:
+        json.dump(sidecar, file)
+
+    main_control._yaml_cache.clear()
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.1}
+
+
+def test_sidecar_skipped_for_non_string_keys(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("1: one\nnested: {2: two}\n")
+
+    assert load_yaml_cached(str(path)) == {1: 'one', 'nested': {2: 'two'}}
+    # JSON would turn the keys into strings, so nothing is cached
+    assert not os.path.exists(_sidecar(path))
+
+
+def test_failed_sidecar_write_leaves_previous_sidecar(tmp_path, monkeypatch):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+    load_yaml_cached(str(path))
+    with open(_sidecar(path)) as file:
+        previous = file.read()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main_control.os, 'replace', fail_replace)
+    path.write_text("cycle_interval: 0.25\n")
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.25}
+
+    # The sidecar is replaced in one step or not at all, and the temporary file is removed
+    with open(_sidecar(path)) as file:
+        assert file.read() == previous
+    assert os.listdir(os.path.dirname(_sidecar(path))) == [os.path.basename(_sidecar(path))]
+
+
+def test_sidecar_disabled_by_config(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cache_config: false\n")
+    load_yaml_cached(str(path))
+    assert not os.path.exists(_sidecar(path))
+
+
+def test_returns_independent_copies(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("cycle_interval: 0.1\n")
+    load_yaml_cached(str(path))['cycle_interval'] = 9.0
+    assert load_yaml_cached(str(path)) == {'cycle_interval': 0.1}
@@ -0,0 +1,245 @@
+# tests/unit_tests/test_pitch_climb_transition.py
+
+import asyncio
+
+import pytest
+from mavsdk.offboard import OffboardError, OffboardResult
+from mavsdk.telemetry import LandedState
+
+from modules.transition_logic import tailsitter_pitch_program
+from modules.transition_logic.tailsitter_pitch_program import TailsitterPitchProgram
+
+from conftest import feed_samples
+
+ramp_schedule = TailsitterPitchProgram._ramp_schedule
+quantize = TailsitterPitchProgram._quantize
+
+
+def test_ramp_schedule_reaches_end_and_holds():
+    schedule = ramp_schedule(0.5, 0.8, ramp_steps=3, total_steps=5)
+    assert len(schedule) == 5
+    assert schedule[0] == pytest.approx(0.6)
+    assert schedule[2] == pytest.approx(0.8)
+    assert schedule[3:] == [0.8, 0.8]
+
+
+def test_ramp_schedule_is_monotonic():
+    increasing = ramp_schedule(0.0, 1.0, ramp_steps=10, total_steps=15)
+    decreasing = ramp_schedule(-3.0, -80.0, ramp_steps=10, total_steps=15)
+    assert all(a <= b for a, b in zip(increasing, increasing[1:]))
+    assert all(a >= b for a, b in zip(decreasing, decreasing[1:]))
+
+
+def test_ramp_schedule_truncated_before_end():
+    # A schedule shorter than the ramp stops partway
+    schedule = ramp_schedule(0.0, 10.0, ramp_steps=10, total_steps=4)
+    assert schedule == pytest.approx([1.0, 2.0, 3.0, 4.0])
+
+
+def test_ramp_schedule_without_ramp_steps_holds_start():
+    assert ramp_schedule(0.7, 0.9, ramp_steps=0, total_steps=3) == [0.7, 0.7, 0.7]
+    assert ramp_schedule(0.7, 0.9, ramp_steps=5, total_steps=0) == []
+
+
+@pytest.mark.parametrize("value, resolution, expected", [
+    (12.3, 0.25, 12.25),
+    (12.4, 0.25, 12.5),
+    (-41.13, 0.25, -41.25),
+    (0.6012, 0.005, 0.6),
+    (5.0, 1.0, 5.0),
+])
+def test_quantize_rounds_to_resolution(value, resolution, expected):
+    assert quantize(value, resolution) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("resolution", [0, -0.25])
+def test_quantize_disabled_returns_value(resolution):
+    assert quantize(12.345, resolution) == 12.345
+
+
+def test_quantized_ramp_stays_monotonic():
+    schedule = [quantize(value, 0.25) for value in ramp_schedule(-3.0, -80.0, 200, 200)]
+    assert schedule[-1] == -80.0
+    assert all(a >= b for a, b in zip(schedule, schedule[1:]))
+
+
+def _record_pitch(program) -> list:
+    pitches = []
+    program.drone.offboard.set_attitude.side_effect = lambda attitude: pitches.append(attitude.pitch_deg)
+    return pitches
+
+
+def test_completed_ramp_does_not_over_tilt(make_program):
+    # Over-tilt only continues a ramp that stopped short of max_tilt_pitch
+    program = make_program(cycle_interval=0.01, throttle_ramp_time=0.05, forward_transition_time=0.05,
+                           max_tilt_pitch=80.0, over_tilt_enabled=True, max_allowed_tilt=110.0)
+    pitches = _record_pitch(program)
+
+    asyncio.run(program.ramp_throttle_and_tilt())
+
+    assert pitches[-1] == -80.0
+    assert min(pitches) == -80.0
+
+
+def _landed_states(*states):
+    async def stream():
+        for state in states:
+            yield state
+    return stream
+
+
+def test_takeoff_waits_for_in_air(make_program):
+    program = make_program(takeoff_timeout=1.0)
+    feed_samples(program.telemetry_handler)
+    program.drone.telemetry.landed_state = _landed_states(
+        LandedState.ON_GROUND, LandedState.TAKING_OFF, LandedState.IN_AIR
+    )
+
+    asyncio.run(program.arm_and_takeoff())
+
+    program.drone.action.takeoff.assert_awaited_once()
+    program.drone.action.return_to_launch.assert_not_awaited()
+
+
+def test_takeoff_fails_when_landed_state_stream_ends(make_program):
+    program = make_program(takeoff_timeout=1.0)
+    feed_samples(program.telemetry_handler)
+    program.drone.telemetry.landed_state = _landed_states(LandedState.ON_GROUND, LandedState.TAKING_OFF)
+
+    with pytest.raises(RuntimeError, match="IN_AIR"):
+        asyncio.run(program.arm_and_takeoff())
+
+    program.drone.offboard.start.assert_not_awaited()
+
+
+def test_climb_aborts_when_position_stream_stalls(make_program):
+    program = make_program(initial_climb_height=20.0, position_timeout=0.05)
+    feed_samples(program.telemetry_handler, altitude=5.0)
+
+    with pytest.raises(RuntimeError, match="No position telemetry"):
+        asyncio.run(program.initial_climb_phase())
+
+    program.drone.offboard.set_velocity_body.assert_awaited_once()
+
+
+def _ready_to_ramp(make_program, **config):
+    # Airborne above both climb targets, so execute_transition goes straight to the ramp
+    program = make_program(safety_lock=False, initial_climb_height=5.0, transition_base_altitude=10.0,
+                           cycle_interval=0.01, **config)
+    feed_samples(program.telemetry_handler, altitude=12.0)
+    program.drone.telemetry.landed_state = _landed_states(LandedState.IN_AIR)
+    return program
+
+
+def test_ramp_failure_aborts_once_and_cancels_monitor(make_program):
+    program = _ready_to_ramp(make_program, transition_timeout=5.0)
+    program.drone.offboard.set_attitude.side_effect = RuntimeError("link lost")
+
+    assert asyncio.run(asyncio.wait_for(program.execute_transition(), timeout=2.0)) == "failure"
+
+    assert program.abort_event.is_set()
+    program.drone.action.return_to_launch.assert_awaited_once()
+    program.drone.action.transition_to_fixedwing.assert_not_awaited()
+
+
+def test_takeoff_failure_aborts_once(make_program):
+    program = _ready_to_ramp(make_program)
+    program.drone.telemetry.landed_state = _landed_states(LandedState.ON_GROUND)
+
+    assert asyncio.run(program.execute_transition()) == "failure"
+
+    program.drone.offboard.start.assert_not_awaited()
+    program.drone.action.return_to_launch.assert_awaited_once()
+
+
+def test_monitor_times_out_and_aborts(make_program):
+    program = make_program(transition_timeout=0.05)
+    feed_samples(program.telemetry_handler, airspeed=5.0)
+
+    async def run():
+        # As the ramp does once it sends its first setpoint
+        program.fwd_transition_start_time = asyncio.get_running_loop().time()
+        program.ramping_started_event.set()
+        return await asyncio.wait_for(program.monitor_and_switch(), timeout=1.0)
+
+    assert asyncio.run(run()) == "failure"
+
+    assert program.abort_event.is_set()
+    program.drone.action.return_to_launch.assert_awaited_once()
+    program.drone.action.transition_to_fixedwing.assert_not_awaited()
+
+
+def test_abort_commands_run_concurrently(make_program):
+    program = make_program(abort_command_timeout=1.0)
+    events = []
+
+    def command(name):
+        async def run():
+            events.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            events.append(f"{name} end")
+        return run
+
+    program.drone.offboard.stop.side_effect = command("stop")
+    program.drone.action.transition_to_multicopter.side_effect = command("multicopter")
+    program.drone.action.return_to_launch.side_effect = command("rtl")
+
+    assert asyncio.run(program.abort_transition()) == "failure"
+
+    # Offboard stop and the multicopter transition overlap; RTL waits for both
+    assert set(events[:2]) == {"stop start", "multicopter start"}
+    assert events[-2:] == ["rtl start", "rtl end"]
+
+
+def test_abort_continues_past_unanswered_command(make_program):
+    program = make_program(abort_command_timeout=0.05)
+
+    async def hang():
+        await asyncio.sleep(10.0)
+
+    program.drone.offboard.stop.side_effect = hang
+
+    asyncio.run(asyncio.wait_for(program.abort_transition(), timeout=1.0))
+
+    program.drone.action.transition_to_multicopter.assert_awaited_once()
+    program.drone.action.return_to_launch.assert_awaited_once()
+
+
+def _offboard_error():
+    return OffboardError(OffboardResult(OffboardResult.Result.NO_SETPOINT_SET, "no setpoint"), "start()")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Records the backoff delays without waiting them out, with the jitter removed
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(tailsitter_pitch_program.random, "uniform", lambda a, b: 0.0)
+    return delays
+
+
+def test_offboard_start_backs_off_between_attempts(make_program, sleeps):
+    program = make_program()
+    program.drone.offboard.start.side_effect = [_offboard_error(), _offboard_error(), None]
+
+    asyncio.run(program.start_offboard(retries=3))
+
+    assert sleeps == [0.5, 1.0]
+    assert program.drone.offboard.start.await_count == 3
+    # The zero-velocity setpoint is sent once, not on every attempt
+    program.drone.offboard.set_velocity_body.assert_awaited_once()
+
+
+def test_offboard_start_backoff_is_capped(make_program, sleeps):
+    program = make_program()
+    program.drone.offboard.start.side_effect = _offboard_error()
+
+    with pytest.raises(RuntimeError, match="Offboard mode activation failed"):
+        asyncio.run(program.start_offboard(retries=6))
+
+    # Capped at 4 s, and no sleep after the last attempt
+    assert sleeps == [0.5, 1.0, 2.0, 4.0, 4.0]
@@ -0,0 +1,64 @@
+# tests/unit_tests/test_telemetry_handler.py
+
+import pytest
+from mavsdk.telemetry import EulerAngle, FixedwingMetrics, PositionNed, PositionVelocityNed, VelocityNed
+
+from modules.telemetry_handler import TelemetryHandler, TelemetrySnapshot, TelemetryView
+
+
+def test_snapshot_defaults_without_samples():
+    snapshot = TelemetrySnapshot()
+    assert snapshot.position_velocity_ned is None
+    assert snapshot.fixedwing_metrics is None
+    assert snapshot.euler_angle is None
+    assert (snapshot.altitude, snapshot.airspeed, snapshot.climb_rate, snapshot.throttle) == (0.0, 0.0, 0.0, 0.0)
+    assert (snapshot.pitch, snapshot.roll, snapshot.yaw) == (0.0, 0.0, 0.0)
+
+
+def test_view_hides_streams_without_samples():
+    snapshot = TelemetrySnapshot()
+    view = TelemetryView(snapshot)
+    assert len(view) == 0
+    assert list(view) == []
+    assert view.get('euler_angle') is None
+    assert view.get('euler_angle', 'missing') == 'missing'
+    assert 'euler_angle' not in view
+    with pytest.raises(KeyError):
+        view['euler_angle']
+
+
+def test_view_ignores_derived_and_unknown_keys():
+    view = TelemetryView(TelemetrySnapshot())
+    for key in ('altitude', 'airspeed', 'unknown'):
+        assert view.get(key) is None
+        with pytest.raises(KeyError):
+            view[key]
+
+
+def test_view_is_live():
+    snapshot = TelemetrySnapshot()
+    view = TelemetryView(snapshot)
+    euler = EulerAngle(1.0, -20.0, 5.0, 123)
+    snapshot.euler_angle = euler
+    assert view['euler_angle'] is euler
+    assert list(view) == ['euler_angle']
+    assert len(view) == 1
+
+
+def test_handler_derives_flight_values_from_samples():
+    handler = TelemetryHandler(drone=None, config={})
+    snapshot = handler.get_snapshot()
+
+    handler._on_position_ned(PositionVelocityNed(PositionNed(1.0, 2.0, -12.5), VelocityNed(20.0, 1.0, 0.0)))
+    assert snapshot.altitude == 12.5
+    # The other streams keep their defaults until they deliver a sample
+    assert snapshot.euler_angle is None
+    assert (snapshot.pitch, snapshot.airspeed) == (0.0, 0.0)
+
+    handler._on_fixedwing_metrics(FixedwingMetrics(21.0, 0.6, 1.5))
+    assert (snapshot.airspeed, snapshot.throttle, snapshot.climb_rate) == (21.0, 0.6, 1.5)
+
+    handler._on_euler_angle(EulerAngle(2.0, -45.0, 90.0, 0))
+    assert (snapshot.roll, snapshot.pitch, snapshot.yaw) == (2.0, -45.0, 90.0)
+
+    assert set(handler.get_telemetry()) == {'position_velocity_ned', 'fixedwing_metrics', 'euler_angle'}